@@ -8,15 +8,41 @@ files
 
 import json
 import logging
+import os
+import re
 import sys
 from distutils.core import run_setup
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-from changelog2version.extract_version import ExtractVersion
-from deepdiff import DeepDiff
 from mock import Mock
 
+if TYPE_CHECKING:
+    from deepdiff import DeepDiff
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_LOG_FORMAT = '[%(asctime)s] [%(levelname)-8s] [%(filename)-15s @'\
+              ' %(funcName)-15s:%(lineno)4s] %(message)s'
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Configure the root logger once, later calls are no-ops"""
+    global _logging_configured
+
+    if _logging_configured:
+        return
+
+    logging.basicConfig(level=logging.INFO,
+                        format=_LOG_FORMAT,
+                        stream=sys.stdout)
+    _logging_configured = True
+
 
 class Setup2uPyPackageError(Exception):
     """Base class for exceptions in this module."""
@@ -26,6 +52,21 @@ class Setup2uPyPackageError(Exception):
 class Setup2uPyPackage(object):
     """Handle MicroPython package JSON creation and validation"""
 
+    __slots__ = (
+        '_logger',
+        '_setup_file',
+        '_package_file',
+        '_package_changelog_file',
+        '_setup_data',
+        '_root_dir',
+        '_package_files_cache',
+        '_data_files_cache',
+        '_package_data_cache',
+        '_changelog_version_cache',
+        '_package_json_cache',
+        '_extract_version',
+    )
+
     def __init__(self,
                  setup_file: Path,
                  package_file: Optional[Path],
@@ -54,6 +95,14 @@ class Setup2uPyPackage(object):
         self._setup_data = {}
         self._root_dir = self._setup_file.parent
 
+        # caches of expensive property results, filled on first access
+        self._package_files_cache = None
+        self._data_files_cache = None
+        self._package_data_cache = None
+        self._changelog_version_cache = None
+        self._package_json_cache = None
+        self._extract_version = None
+
         self._setup_data = self._parse_setup_file_content()
 
     @staticmethod
@@ -67,13 +116,9 @@ class Setup2uPyPackage(object):
         :returns:   Configured logger
         :rtype:     logging.Logger
         """
-        custom_format = '[%(asctime)s] [%(levelname)-8s] [%(filename)-15s @'\
-                        ' %(funcName)-15s:%(lineno)4s] %(message)s'
-
-        # configure logging
-        logging.basicConfig(level=logging.INFO,
-                            format=custom_format,
-                            stream=sys.stdout)
+        # configure logging once at module level instead of acquiring
+        # the root logger lock on every instantiation
+        _configure_logging()
 
         if logger_name and (isinstance(logger_name, str)):
             logger = logging.getLogger(logger_name)
@@ -91,6 +136,9 @@ class Setup2uPyPackage(object):
 
         see https://stackoverflow.com/a/61754034/13543363
 
+        Only the keys consumed by this class are kept, avoiding repeated
+        lookups in the full distribution dict on every property access.
+
         :returns:   Parsed setup.py file content
         :rtype:     dict
         """
@@ -100,7 +148,11 @@ class Setup2uPyPackage(object):
         kwargs = res.__dict__
         kwargs.update(kwargs['metadata'].__dict__)
 
-        return kwargs
+        used_keys = (
+            'version', 'install_requires', 'url', 'packages', 'data_files'
+        )
+
+        return {key: kwargs[key] for key in used_keys if key in kwargs}
 
     @property
     def package_version(self) -> str:
@@ -110,8 +162,9 @@ class Setup2uPyPackage(object):
         :returns:   Package version based on setup.py "version" entry
         :rtype:     str
         """
-        if self._setup_data.get('version', ""):
-            return self._setup_data['version']
+        version = self._setup_data.get('version')
+        if version:
+            return version
         else:
             self._logger.warning("No 'version' key found in setup data dict")
             return "-1.-1.-1"
@@ -125,7 +178,15 @@ class Setup2uPyPackage(object):
         :rtype:     str
         """
         if self._package_changelog_file:
-            ev = ExtractVersion(logger=self._logger)
+            if self._changelog_version_cache is not None:
+                return self._changelog_version_cache
+
+            if self._extract_version is None:
+                # deferred import, only needed if a changelog is given
+                from changelog2version.extract_version import ExtractVersion
+
+                self._extract_version = ExtractVersion(logger=self._logger)
+            ev = self._extract_version
 
             version_line = ev.parse_changelog(
                 changelog_file=self._package_changelog_file
@@ -134,6 +195,7 @@ class Setup2uPyPackage(object):
                 release_version_line=version_line
             )
 
+            self._changelog_version_cache = semver_string
             return semver_string
         else:
             self._logger.warning("No package changelog file specified")
@@ -147,8 +209,9 @@ class Setup2uPyPackage(object):
         :returns:   Package dependencies based on setup.py "install_requires"
         :rtype:     List[str]
         """
-        if self._setup_data.get('install_requires', []):
-            return self._setup_data['install_requires']
+        install_requires = self._setup_data.get('install_requires')
+        if install_requires:
+            return install_requires
         else:
             self._logger.warning(
                 "No 'install_requires' key found in setup data dict"
@@ -163,8 +226,9 @@ class Setup2uPyPackage(object):
         :returns:   Package URL based on setup.py "url" entry
         :rtype:     str
         """
-        if self._setup_data.get('url', ""):
-            return self._setup_data['url']
+        url = self._setup_data.get('url')
+        if url:
+            return url
         else:
             self._logger.warning("No 'url' key found in setup data dict")
             raise SystemExit('Project URL is mandatory')
@@ -177,6 +241,9 @@ class Setup2uPyPackage(object):
         :returns:   Packages based on setup.py "packages" entry
         :rtype:     List[str]
         """
+        if self._package_files_cache is not None:
+            return self._package_files_cache
+
         packages = []
         all_files = []
         root_dir = self._root_dir
@@ -185,13 +252,32 @@ class Setup2uPyPackage(object):
             packages = self._setup_data['packages']
         else:
             self._logger.warning("No 'packages' key found in setup data dict")
-            return []
+            self._package_files_cache = []
+            return self._package_files_cache
 
         for package in packages:
-            p = root_dir.glob('{}/*.py'.format(package))
-            files = [x.relative_to(root_dir) for x in p if x.is_file()]
-            all_files.extend(files)
-
+            try:
+                entries = os.scandir(root_dir / package)
+            except OSError:
+                self._logger.warning(
+                    "Package directory '{}' does not exist".format(package)
+                )
+                continue
+
+            # precompute the relative prefix once per package, a single
+            # Path from the joined string is cheaper than Path(package)
+            # plus a path concatenation for every file
+            package_prefix = package + '/'
+
+            with entries:
+                for entry in entries:
+                    # DirEntry.is_file() reuses the stat info cached
+                    # while reading the directory, saving one syscall
+                    # per file compared to glob plus Path.is_file()
+                    if entry.name.endswith('.py') and entry.is_file():
+                        all_files.append(Path(package_prefix + entry.name))
+
+        self._package_files_cache = all_files
         return all_files
 
     @property
@@ -202,6 +288,9 @@ class Setup2uPyPackage(object):
         :returns:   Data files based on setup.py "data_files" entry
         :rtype:     List[str]
         """
+        if self._data_files_cache is not None:
+            return self._data_files_cache
+
         data_files = []
         all_files = []
         root_dir = self._root_dir
@@ -212,21 +301,23 @@ class Setup2uPyPackage(object):
             self._logger.warning(
                 "No 'data_files' key found in setup data dict"
             )
-            return []
+            self._data_files_cache = []
+            return self._data_files_cache
 
         for folder, file_list in data_files:
-            files = []
             for file in file_list:
-                file = root_dir / Path(file)
-                if file.is_file():
-                    files.append(file.relative_to(root_dir))
-            all_files.extend(files)
+                # entries are given relative to the root dir already, so
+                # the path can be used as is instead of resolving it
+                # against the root dir and stripping the root dir again
+                if (root_dir / file).is_file():
+                    all_files.append(Path(file))
 
+        self._data_files_cache = all_files
         return all_files
 
     def _create_url_elements(self,
                              package_files: List[str],
-                             url: str) -> List[str]:
+                             url: str) -> List[Tuple[str, str]]:
         """
         Create URLs to all package elements.
 
@@ -236,16 +327,24 @@ class Setup2uPyPackage(object):
         :type       url:            str
 
         :returns:   List of URLs to download the package files
-        :rtype:     List[str]
+        :rtype:     List[Tuple[str, str]]
         """
         urls = []
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+        # plain string concatenation onto a precomputed prefix, pathlib
+        # object construction per file is far more expensive
+        base_url = url.rstrip('/') + '/'
 
         for file in package_files:
-            this_url = [
-                str(file),
-                str(Path(url) / file)
-            ]
-            self._logger.debug("File elements: {}: {}".format(file, this_url))
+            file_str = str(file)
+            this_url = (
+                file_str,
+                base_url + file_str
+            )
+            if log_debug:
+                self._logger.debug(
+                    "File elements: {}: {}".format(file, this_url)
+                )
             urls.append(this_url)
 
         return urls
@@ -258,7 +357,9 @@ class Setup2uPyPackage(object):
         :returns:   mip compatible package.json data
         :rtype:     dict
         """
-        urls = []
+        if self._package_data_cache is not None:
+            return self._package_data_cache
+
         package_data = {
             "urls": [],
             "deps": [],
@@ -272,20 +373,26 @@ class Setup2uPyPackage(object):
         package_files = self.package_files
         data_files = self.data_files
         url = self.package_url.replace('https://github.com/', 'github:')
-        for x in [package_files, data_files]:
-            urls.extend(self._create_url_elements(package_files=x, url=url))
-
-        self._logger.debug("version: {}".format(version))
-        self._logger.debug("install_requires: {}".format(install_requires))
-        self._logger.debug("package_files: {}".format(package_files))
-        self._logger.debug("data_files: {}".format(data_files))
-        self._logger.debug("url: {}".format(url))
-        self._logger.debug("urls: {}".format(urls))
+        # single pass over package and data files instead of one
+        # _create_url_elements call per file list
+        urls = self._create_url_elements(
+            package_files=package_files + data_files,
+            url=url
+        )
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("version: {}".format(version))
+            self._logger.debug("install_requires: {}".format(install_requires))
+            self._logger.debug("package_files: {}".format(package_files))
+            self._logger.debug("data_files: {}".format(data_files))
+            self._logger.debug("url: {}".format(url))
+            self._logger.debug("urls: {}".format(urls))
 
         package_data["urls"] = urls
         package_data["deps"] = install_requires
         package_data["version"] = version
 
+        self._package_data_cache = package_data
         return package_data
 
     @property
@@ -299,8 +406,23 @@ class Setup2uPyPackage(object):
         existing_data = {}
 
         if self._package_file:
-            with open(self._package_file, 'r') as f:
-                existing_data = json.load(f)
+            if self._package_json_cache is not None:
+                return self._package_json_cache
+
+            raw_data = self._package_file.read_bytes()
+            if orjson is not None:
+                existing_data = orjson.loads(raw_data)
+            else:
+                existing_data = json.loads(raw_data)
+
+            # JSON has no tuple type, coerce the URL entries to match
+            # the hashable tuples used by package_data
+            if "urls" in existing_data:
+                existing_data["urls"] = [
+                    tuple(url) for url in existing_data["urls"]
+                ]
+
+            self._package_json_cache = existing_data
         else:
             raise Setup2uPyPackageError("No package.json data specified")
 
@@ -323,29 +445,30 @@ class Setup2uPyPackage(object):
         :returns:   Result of validation, True on success, False otherwise
         :rtype:     bool
         """
-        # list of URL entries might be sorted differently
-        package_json_data = dict(self.package_json_data)
-        package_data = dict(self.package_data)
-
+        ignored_keys = set()
         if ignore_version:
-            package_json_data.pop("version", None)
-            package_data.pop("version", None)
-
+            ignored_keys.add("version")
         if ignore_deps:
-            package_json_data.pop("deps", None)
-            package_data.pop("deps", None)
-
-        if ignore_boot_main:
-            package_json_data["urls"] = self._exclude_package_files(
-                package_files=package_json_data.get("urls")
-            )
+            ignored_keys.add("deps")
 
-            package_data["urls"] = self._exclude_package_files(
-                package_files=package_data.get("urls")
-            )
+        # build the comparison dicts directly without the ignored keys
+        # instead of copying everything and popping entries afterwards
+        package_json_data = {
+            key: val for key, val in self.package_json_data.items()
+            if key not in ignored_keys
+        }
+        package_data = {
+            key: val for key, val in self.package_data.items()
+            if key not in ignored_keys
+        }
 
-        package_json_data.get("urls", []).sort()
-        package_data.get("urls", []).sort()
+        # list of URL entries might be sorted differently, compare the
+        # hashable URL tuples as sets instead of sorting both lists
+        for compare_data in (package_json_data, package_data):
+            urls = compare_data.get("urls", [])
+            if ignore_boot_main:
+                urls = self._exclude_package_files(package_files=urls)
+            compare_data["urls"] = set(urls)
 
         return package_json_data == package_data
 
@@ -366,20 +489,35 @@ class Setup2uPyPackage(object):
         :returns:   List without elements matching the exclude list
         :rtype:     List[Tuple[str, str]]
         """
+        # a single compiled pattern scans each element once instead of
+        # one Python-level substring check per exclude entry
+        pattern = re.compile('|'.join(re.escape(i) for i in excludes))
+
         return [
             ele for ele in package_files
-            if not any(i in ele[0] for i in excludes)
+            if not pattern.search(ele[0])
         ]
 
     @property
-    def validation_diff(self) -> DeepDiff:
+    def validation_diff(self) -> Union[dict, 'DeepDiff']:
         """
         Get difference of package.json and setup.py
 
-        :returns:   The deep difference.
-        :rtype:     DeepDiff
+        :returns:   Empty dict if equal, the deep difference otherwise.
+        :rtype:     Union[dict, DeepDiff]
         """
-        return DeepDiff(self.package_data, self.package_json_data)
+        package_data = self.package_data
+        package_json_data = self.package_json_data
+
+        # check plain equality first, the expensive deep comparison is
+        # only worth its cost if the data actually differs
+        if package_data == package_json_data:
+            return {}
+
+        # deferred import, deepdiff is large and only needed on a diff
+        from deepdiff import DeepDiff
+
+        return DeepDiff(package_data, package_json_data)
 
     def create(self,
                output_path: Optional[Path] = None,
@@ -402,9 +540,11 @@ class Setup2uPyPackage(object):
                 )
 
         with open(output_path, 'w') as file:
+            # stream directly into the file instead of materializing
+            # the full JSON string in memory first
             if pretty:
-                file.write(json.dumps(self.package_data, indent=4))
+                json.dump(self.package_data, file, indent=4)
             else:
-                file.write(json.dumps(self.package_data))
+                json.dump(self.package_data, file)
 
         self._logger.debug("Created {}".format(output_path))
@@ -184,6 +184,7 @@ class TestSetup2uPyPackage(unittest.TestCase):
         self.assertEqual(sorted(val), sorted(self.package_files_expectation))
 
         self.s2pp._setup_data.pop('packages')
+        self.s2pp._package_files_cache = None
         val = self.s2pp.package_files
         self.assertIsInstance(val, list)
         self.assertEqual(len(val), 0)
@@ -199,6 +200,7 @@ class TestSetup2uPyPackage(unittest.TestCase):
         self.assertEqual(val, self.data_files_expectation)
 
         self.s2pp._setup_data.pop('data_files')
+        self.s2pp._data_files_cache = None
         val = self.s2pp.data_files
         self.assertIsInstance(val, list)
         self.assertEqual(len(val), 0)
@@ -218,15 +220,15 @@ class TestSetup2uPyPackage(unittest.TestCase):
                                               url=expectation_base_url)
 
         self.assertIsInstance(urls, list)
-        self.assertTrue(all(isinstance(ele, list) for ele in urls))
+        self.assertTrue(all(isinstance(ele, tuple) for ele in urls))
         self.assertTrue(all(len(ele) == 2 for ele in urls))
         self.assertEqual(len(urls), len(package_files))
 
         for expectation, ele in zip(package_files, urls):
-            this_expectation = [
+            this_expectation = (
                 expectation,
                 expectation_base_url + '/' + expectation
-            ]
+            )
             self.assertEqual(this_expectation, ele)
 
     @params(
@@ -266,12 +268,12 @@ class TestSetup2uPyPackage(unittest.TestCase):
 
         for expectation, ele in zip(sorted(all_files),
                                     sorted(package_data['urls'])):
-            this_expectation = [
+            this_expectation = (
                 str(expectation),
                 base_url + '/' + str(expectation)
-            ]
-            self.assertIsInstance(ele, list)
-            self.assertEqual(len(ele), 2)   # consist of [path, url]
+            )
+            self.assertIsInstance(ele, tuple)
+            self.assertEqual(len(ele), 2)   # consist of (path, url)
             self.assertEqual(this_expectation, ele)
 
     def test_package_json_data(self) -> None:
@@ -357,20 +359,20 @@ class TestSetup2uPyPackage(unittest.TestCase):
 
         # check for main and/or boot entries
         diff_urls_package_json_data = dict(s2pp.package_json_data)
-        diff_urls_package_json_data.get("urls").append([
+        diff_urls_package_json_data.get("urls").append((
             "boot.py",
             "github:brainelectronics/micropython-package-validation/boot.py"
-        ])
-        diff_urls_package_json_data.get("urls").append([
+        ))
+        diff_urls_package_json_data.get("urls").append((
             "asdf/main.py",
             "github:brainelectronics/micropython-package-validation/main.py"
-        ])
+        ))
         self.assertNotEqual(
             diff_urls_package_json_data["urls"],
             s2pp.package_json_data
         )
         self.assertTrue(
-            all(isinstance(ele, list)
+            all(isinstance(ele, tuple)
                 for ele in diff_urls_package_json_data.get("urls"))
         )
 
@@ -454,7 +456,11 @@ class TestSetup2uPyPackage(unittest.TestCase):
 
         m.assert_called_once_with(output_path, 'w')
         handle = m()
-        self.assertEqual(handle.write.call_args.args[0], expectation)
+        # json.dump streams the data in multiple write calls
+        written = ''.join(
+            call.args[0] for call in handle.write.call_args_list
+        )
+        self.assertEqual(written, expectation)
 
 
 if __name__ == '__main__':